@@ -0,0 +1,98 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3
+"""
+Optional ahead-of-time compiled kernels for the LinLogTransform and its inverse.
+
+Build in place with `cythonize -i _linlog_ext.pyx`, linlogscale picks the extension
+up automatically if it is importable. -ffast-math is deliberately not used, since
+zeros, nan and inf inputs must propagate the same way they do in the numpy
+implementation.
+"""
+
+from cython cimport floating
+from libc.math cimport copysign, exp, fabs, log
+
+# version of the kernel signatures, checked by linlogscale when importing the extension.
+# Increment it (together with _KERNEL_VERSION in linlogscale.py) whenever the
+# signatures of the kernels change.
+KERNEL_VERSION = 1
+
+
+def forward(
+    double linthresh,
+    double linscale_adj,
+    double inv_log_base,
+    double log_linthresh,
+    const floating[::1] values,
+    floating[::1] out,
+):
+    """
+    Compiled elementwise version of LinLogTransform.transform_non_affine (without
+    the clipping), evaluating only one branch per element.
+
+    Parameters
+    ----------
+    linthresh : float
+        The threshold between linear and logarithmic regime.
+    linscale_adj : float
+        The adjusted linscale of the transformation.
+    inv_log_base : float
+        The inverse of the natural logarithm of the base.
+    log_linthresh : float
+        The logarithm of linthresh with respect to the base.
+    values : np.ndarray
+        The flat, contiguous input values to be transformed.
+    out : np.ndarray
+        The flat output array the transformed values are written to.
+    """
+    cdef Py_ssize_t i
+    cdef double x, a, magnitude
+    with nogil:
+        for i in range(values.shape[0]):
+            x = values[i]
+            a = fabs(x)
+            if a <= linthresh:
+                magnitude = linthresh * (1.0 + log(a) * inv_log_base - log_linthresh)
+            else:
+                magnitude = linthresh + linscale_adj * (a - linthresh)
+            out[i] = <floating>(copysign(1.0, x) * magnitude)
+
+
+def inverse(
+    double linthresh,
+    double linscale_adj,
+    double log_base,
+    const floating[::1] values,
+    floating[::1] out,
+):
+    """
+    Compiled elementwise version of InvertedLinLogTransform.transform_non_affine,
+    evaluating only one branch per element.
+
+    Parameters
+    ----------
+    linthresh : float
+        The threshold between linear and logarithmic regime, which is the same
+        before and after the transformation.
+    linscale_adj : float
+        The adjusted linscale of the transformation.
+    log_base : float
+        The natural logarithm of the base.
+    values : np.ndarray
+        The flat, contiguous input values to be transformed.
+    out : np.ndarray
+        The flat output array the transformed values are written to.
+    """
+    cdef Py_ssize_t i
+    cdef double x, a, s, magnitude
+    with nogil:
+        for i in range(values.shape[0]):
+            x = values[i]
+            a = fabs(x)
+            # same as np.sign, inputs that are 0 (or nan) map to 0 (or nan)
+            s = 1.0 if x > 0 else (-1.0 if x < 0 else 0.0)
+            if a <= linthresh:
+                magnitude = linthresh * exp(((a / linthresh) - 1.0) * log_base)
+            else:
+                magnitude = linthresh + (a - linthresh) / linscale_adj
+            out[i] = <floating>(s * magnitude)
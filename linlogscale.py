@@ -1,6 +1,11 @@
-from typing import Any, Optional
+import functools
+import math
+import sys
+import warnings
+from typing import Any, Callable, Optional
 
 import numpy as np
+from matplotlib import MatplotlibDeprecationWarning
 from matplotlib.axes import Axes
 from matplotlib.scale import LogScale
 from matplotlib.ticker import (
@@ -12,8 +17,256 @@ from matplotlib.ticker import (
 )
 from matplotlib.transforms import Transform
 
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional, fall back to pure numpy
+    _HAS_NUMBA = False
+
+try:
+    import _linlog_ext
+except ImportError:  # the compiled extension is optional, see README
+    _linlog_ext = None
+
+# version of the kernel signatures expected from the compiled extension, must match
+# KERNEL_VERSION in _linlog_ext.pyx
+_KERNEL_VERSION: int = 1
+# an extension built from an outdated _linlog_ext.pyx still imports, but its kernels
+# have different signatures, so it is only used if the versions match
+_HAS_EXTENSION = getattr(_linlog_ext, "KERNEL_VERSION", None) == _KERNEL_VERSION
+if _linlog_ext is not None and not _HAS_EXTENSION:
+    warnings.warn(
+        "The compiled _linlog_ext extension is outdated and is not used, rebuild it "
+        "with 'cythonize -i _linlog_ext.pyx'."
+    )
+
+# ###################### KERNELS #######################################################
+
+if _HAS_NUMBA:
+    # fastmath without the 'nnan' and 'ninf' flags, since zeros, nan and inf inputs
+    # must propagate the same way they do in the numpy implementation
+    _FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _fast_log(a: float) -> float:
+        """
+        Fast approximation of the natural logarithm, with a relative error of about
+        2e-8 (roughly single precision), which is plenty for axis transformations.
+        The input is split into mantissa and exponent, and log1p of the reduced
+        mantissa is evaluated using a minimax polynomial.
+
+        Parameters
+        ----------
+        a : float
+            The input value.
+
+        Returns
+        -------
+        float
+            The (approximate) natural logarithm of a.
+        """
+        if not (0.0 < a <= 1.7976931348623157e308):
+            if a == 0.0:
+                return -math.inf
+            if a < 0.0:
+                return math.nan
+            return a + a  # inf and nan
+
+        # reduce a = m * 2**e, with m in [2/3, 4/3)
+        m, e = math.frexp(a)
+        if m < 0.666666667:
+            m = m + m
+            e = e - 1
+        m = m - 1.0
+        s = m * m
+
+        # log1p(m) for m in [-1/3, 1/3]
+        r = -0.130310059
+        t = 0.140869141
+        r = r * s - 0.121484190
+        t = t * s + 0.139814854
+        r = r * s - 0.166846052
+        t = t * s + 0.200120345
+        r = r * s - 0.249996200
+        r = t * m + r
+        r = r * m + 0.333331972
+        r = r * m - 0.500000000
+        r = r * s + m
+        return e * 0.6931471805599453 + r
+
+    @njit(cache=True, fastmath=_FASTMATH, parallel=True)
+    def _linlog_forward(
+        linthresh: float,
+        linscale_adj: float,
+        inv_log_base: float,
+        log_linthresh: float,
+        values: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Compiled elementwise version of LinLogTransform.transform_non_affine (without
+        the clipping), evaluating only one branch per element.
+
+        Parameters
+        ----------
+        linthresh : float
+            The threshold between linear and logarithmic regime.
+        linscale_adj : float
+            The adjusted linscale of the transformation.
+        inv_log_base : float
+            The inverse of the natural logarithm of the base.
+        log_linthresh : float
+            The logarithm of linthresh with respect to the base.
+        values : np.ndarray
+            The flat input values to be transformed.
+        out : np.ndarray
+            The flat output array the transformed values are written to.
+        """
+        for i in prange(values.size):
+            x = values[i]
+            a = abs(x)
+            if a <= linthresh:
+                magnitude = linthresh * (
+                    1.0 + _fast_log(a) * inv_log_base - log_linthresh
+                )
+            else:
+                magnitude = linthresh + linscale_adj * (a - linthresh)
+            out[i] = math.copysign(1.0, x) * magnitude
+
+    @njit(cache=True, fastmath=_FASTMATH, parallel=True)
+    def _linlog_inverse(
+        linthresh: float,
+        linscale_adj: float,
+        log_base: float,
+        values: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Compiled elementwise version of InvertedLinLogTransform.transform_non_affine,
+        evaluating only one branch per element.
+
+        Parameters
+        ----------
+        linthresh : float
+            The threshold between linear and logarithmic regime, which is the same
+            before and after the transformation.
+        linscale_adj : float
+            The adjusted linscale of the transformation.
+        log_base : float
+            The natural logarithm of the base.
+        values : np.ndarray
+            The flat input values to be transformed.
+        out : np.ndarray
+            The flat output array the transformed values are written to.
+        """
+        for i in prange(values.size):
+            x = values[i]
+            a = abs(x)
+            # same as np.sign, inputs that are 0 (or nan) map to 0 (or nan)
+            s = 1.0 if x > 0 else (-1.0 if x < 0 else 0.0)
+            if a <= linthresh:
+                magnitude = linthresh * math.exp(((a / linthresh) - 1.0) * log_base)
+            else:
+                magnitude = linthresh + (a - linthresh) / linscale_adj
+            out[i] = s * magnitude
+
+
+# prefer the ahead-of-time compiled extension, then numba, and fall back to numpy if
+# neither is available
+if _HAS_EXTENSION:
+    _forward_kernel, _inverse_kernel = _linlog_ext.forward, _linlog_ext.inverse
+elif _HAS_NUMBA:
+    _forward_kernel, _inverse_kernel = _linlog_forward, _linlog_inverse
+else:
+    _forward_kernel = _inverse_kernel = None
+
 # ###################### TRANSFORM #####################################################
 
+# Results of transformations on arrays up to this size are cached, since matplotlib
+# transforms the same small arrays (e.g. tick locations) repeatedly while drawing
+_CACHE_MAX_SIZE: int = 64
+
+
+def _validate_parameters(
+    base: float, linthresh: float, linscale: float, precision: str
+) -> None:
+    """
+    Validate the parameters of the (inverted) linear log transformation.
+
+    Parameters
+    ----------
+    base : float
+        Base of the logarithm.
+    linthresh : float
+        The threshold between linear and logarithmic regime.
+    linscale : float
+        Factor by which data within linthresh is linearly scaled.
+    precision : "single" | "double"
+        Floating point precision of the transformation.
+
+    Raises
+    ------
+    ValueError
+        Raised if 'base' is not larger than 1, 'linthresh' is not positive,
+        'linscale' is not positive or 'precision' is neither "single" nor "double".
+    """
+    if base <= 1.0:
+        raise ValueError("'base' must be larger than 1")
+    if linthresh <= 0.0:
+        raise ValueError("'linthresh' must be positive")
+    if linscale <= 0.0:
+        raise ValueError("'linscale' must be positive")
+    if precision not in ("single", "double"):
+        raise ValueError("'precision' must either be 'single' or 'double'")
+
+
+def _working_dtype(values: np.ndarray, precision: str) -> type:
+    """
+    Get the floating point type the transformation of values is calculated in.
+    Single precision halves the memory traffic and doubles the number of SIMD lanes,
+    at an accuracy that is still far below a pixel.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The input values to be transformed.
+    precision : "single" | "double"
+        Floating point precision of the transformation. Inputs that are already
+        single precision are always transformed in single precision.
+
+    Returns
+    -------
+    type
+        np.float32 or np.float64.
+    """
+    if precision == "single" or values.dtype == np.float32:
+        return np.float32
+    return np.float64
+
+
+def _array_module(values: Any) -> Any:
+    """
+    Get the array module the values belong to, so that arrays on the GPU are
+    transformed on the GPU.
+
+    Parameters
+    ----------
+    values : Any
+        The input values to be transformed.
+
+    Returns
+    -------
+    Any
+        cupy for cupy arrays, numpy otherwise.
+    """
+    # cupy arrays can only exist if cupy has already been imported, so cupy is never
+    # imported here
+    cupy = sys.modules.get("cupy")
+    if cupy is not None:
+        return cupy.get_array_module(values)
+    return np
+
 
 class LinLogTransform(Transform):
     """
@@ -24,7 +277,12 @@ class LinLogTransform(Transform):
     output_dims: int = 1
 
     def __init__(
-        self, base: float, linthresh: float, linscale: float, clip_value: float | str
+        self,
+        base: float,
+        linthresh: float,
+        linscale: float,
+        clip_value: float | str,
+        precision: str = "double",
     ) -> None:
         """
         Initialize the log transformation.
@@ -43,27 +301,103 @@ class LinLogTransform(Transform):
             Inputs that are <=0 (and therefore make a problem for the log scale) are set
             to this value in LinLogTransform. If the clip_value is "mask", values will
             be set to -np.inf and not plotted.
+        precision : "single" | "double", optional
+            Floating point precision of the transformation. The default is "double".
         Raises
         ------
         ValueError
-            Raised if 'base' is not larger than 1, 'linthresh' is not positive or
-            'linscale' is not positive.
+            Raised if 'base' is not larger than 1, 'linthresh' is not positive,
+            'linscale' is not positive or 'precision' is neither "single" nor
+            "double".
         """
         super().__init__()
+        _validate_parameters(base, linthresh, linscale, precision)
+
+        # the parameters are read-only, since the constants below are derived from them
+        self._base: float = base
+        self._linthresh: float = linthresh
+        self._linscale: float = linscale
+        self._clip_value: float | str = clip_value
+        self._precision: str = precision
+        self._linscale_adj: float = linscale / (1.0 - base**-1)
+        self._log_base: float = np.log(base)
+        self._inv_log_base: float = 1.0 / self._log_base
+        # dedicated ufuncs for common bases avoid the scaling by 1/log(base)
+        self._log_fn: Optional[np.ufunc] = {2.0: np.log2, 10.0: np.log10}.get(
+            float(base)
+        )
+        # log(a/linthresh) is calculated as log(a) - log(linthresh), saving a division
+        self._log_linthresh: float = float(self._log(linthresh))
+        # transformed value assigned to inputs <= 0, None if clip_value is invalid
+        self._clip_out: Optional[float] = None
+        if clip_value == "mask":
+            self._clip_out = -np.inf
+        elif isinstance(clip_value, (int, float)) and clip_value > 0:
+            self._clip_out = self.linthresh * (
+                1.0 + float(self._log(clip_value)) - self._log_linthresh
+            )
+        # key and result of the last transformation of a small array
+        self._cache: tuple[Optional[tuple], Optional[np.ndarray]] = (None, None)
+        # the parameters are fixed at construction, so they are bound once instead of
+        # being looked up on every call
+        self._kernel: Optional[Callable] = None
+        if _forward_kernel is not None:
+            self._kernel = functools.partial(
+                _forward_kernel,
+                self.linthresh,
+                self._linscale_adj,
+                self._inv_log_base,
+                self._log_linthresh,
+            )
 
-        if base <= 1.0:
-            raise ValueError("'base' must be larger than 1")
-        if linthresh <= 0.0:
-            raise ValueError("'linthresh' must be positive")
-        if linscale <= 0.0:
-            raise ValueError("'linscale' must be positive")
+    @property
+    def base(self) -> float:
+        """Base of the logarithm."""
+        return self._base
 
-        self.base: float = base
-        self.linthresh: float = linthresh
-        self.linscale: float = linscale
-        self.clip_value: float | str = clip_value
-        self._linscale_adj: float = linscale / (1.0 - self.base**-1)
-        self._log_base: float = np.log(base)
+    @property
+    def linthresh(self) -> float:
+        """Threshold between linear and logarithmic regime."""
+        return self._linthresh
+
+    @property
+    def linscale(self) -> float:
+        """Factor by which the linear range is stretched."""
+        return self._linscale
+
+    @property
+    def clip_value(self) -> float | str:
+        """Value assigned to inputs <= 0, or "mask"."""
+        return self._clip_value
+
+    @property
+    def precision(self) -> str:
+        """Floating point precision of the transformation."""
+        return self._precision
+
+    def _log(self, values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate the logarithm of values with respect to the transformation base.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The input values.
+        out : Optional[np.ndarray], optional
+            Array the result is written to. The default is None, in which case a new
+            array is allocated.
+
+        Returns
+        -------
+        np.ndarray
+            The logarithm of the values.
+        """
+        if self._log_fn is not None:
+            return self._log_fn(values, out=out)
+        if out is None:
+            return np.log(values) * self._inv_log_base
+        np.log(values, out=out)
+        return np.multiply(out, self._inv_log_base, out=out)
 
     def transform_non_affine(self, values: np.ndarray) -> np.ndarray:
         """
@@ -79,35 +413,105 @@ class LinLogTransform(Transform):
         np.ndarray
             The transformed values.
         """
-        with np.errstate(divide="ignore", invalid="ignore"):
-            out = np.where(
-                np.abs(values) <= self.linthresh,
-                np.sign(values)
-                * self.linthresh
-                * (1.0 + np.log(np.abs(values) / self.linthresh) / self._log_base),
-                values,
+        xp = _array_module(values)
+        values = xp.asarray(values)
+        dtype = _working_dtype(values, self.precision)
+        # strided or misaligned arrays would miss the vectorized loops of the numpy
+        # ufuncs and cannot be passed to the compiled kernels, so they are copied
+        # (unlike ascontiguousarray, this keeps 0-d inputs 0-d)
+        values = xp.asarray(values, dtype=dtype, order="C")
+
+        key = None
+        if xp is np and values.size <= _CACHE_MAX_SIZE:
+            key = (
+                values.shape,
+                values.dtype.str,
+                values.tobytes(),
             )
+            cached_key, cached_out = self._cache
+            if cached_out is not None and cached_key == key:
+                return cached_out.copy()
 
-            out = np.where(
-                np.abs(values) > self.linthresh,
-                self.linthresh
-                + np.sign(values)
-                * self._linscale_adj
-                * (np.abs(values) - self.linthresh),
-                out,
-            )
+        if xp is np and self._kernel is not None:
+            out = np.empty_like(values)
+            self._kernel(values.ravel(), out.ravel())
+        else:
+            # like the kernels, the numpy implementation works on a flat view, so that
+            # 0-d inputs also support in-place operations and masking
+            out = self._transform_numpy(values.ravel(), xp).reshape(values.shape)
 
-            # Clipping the values similar to LogScale
-            if self.clip_value == "mask":
-                out[values <= 0] = -np.inf
-            elif isinstance(self.clip_value, (int, float)) and self.clip_value > 0:
-                out[values <= 0] = self.linthresh * (
-                    1.0
-                    + np.log(np.abs(self.clip_value) / self.linthresh) / self._log_base
-                )
-            else:
-                raise ValueError("clip_value must either be 'mask' or a number>0.")
-            return out
+        # Clipping the values similar to LogScale
+        if self._clip_out is None:
+            raise ValueError("clip_value must either be 'mask' or a number>0.")
+        out[values <= 0] = self._clip_out
+
+        if key is not None:
+            self._cache = (key, out.copy())
+        return out
+
+    def _transform_numpy(self, values: np.ndarray, xp: Any = np) -> np.ndarray:
+        """
+        Perform the custom log transformation on values using numpy, without
+        clipping.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The input values to be transformed.
+        xp : Any, optional
+            The array module of the values, numpy or cupy. The default is numpy.
+
+        Returns
+        -------
+        np.ndarray
+            The transformed values.
+        """
+        linthresh = self.linthresh
+        linscale_adj = self._linscale_adj
+        log_linthresh = self._log_linthresh
+        # the numpy ufuncs in _log dispatch to cupy for cupy arrays
+        log = self._log
+        # inputs of the logarithm are clipped to the smallest positive (subnormal)
+        # float, so that log(0) is never evaluated while valid subnormal inputs are
+        # unaffected (results for inputs <= 0 are clipped later anyway)
+        smallest = np.finfo(values.dtype).smallest_subnormal
+
+        # the magnitude is calculated from the absolute values and the sign is
+        # applied once at the end
+        abs_values = xp.abs(values)
+
+        # the mask is calculated once and also decides if a branch can be skipped
+        log_mask = abs_values <= linthresh
+        num_log = xp.count_nonzero(log_mask)
+
+        # intermediate results are calculated in-place, to avoid temporary arrays
+        if num_log == 0:
+            # All values in the linear regime, skip the logarithm entirely
+            out = xp.subtract(abs_values, linthresh)
+            out *= linscale_adj
+            out += linthresh
+        elif num_log == log_mask.size:
+            # All values in the logarithmic regime, no masking needed
+            out = xp.maximum(abs_values, smallest, out=abs_values)
+            log(out, out=out)
+            out -= log_linthresh - 1.0
+            out *= linthresh
+        else:
+            # The cheap linear branch is calculated for all elements, the
+            # logarithm only for the elements that need it
+            out = xp.subtract(abs_values, linthresh)
+            out *= linscale_adj
+            out += linthresh
+
+            log_values = abs_values[log_mask]
+            xp.maximum(log_values, smallest, out=log_values)
+            log(log_values, out=log_values)
+            log_values -= log_linthresh - 1.0
+            log_values *= linthresh
+            out[log_mask] = log_values
+
+        out *= xp.copysign(1.0, values)
+        return out
 
     def inverted(self) -> "InvertedLinLogTransform":
         """
@@ -119,7 +523,7 @@ class LinLogTransform(Transform):
             The inverse transformation object.
         """
         return InvertedLinLogTransform(
-            self.base, self.linthresh, self.linscale, self.clip_value
+            self.base, self.linthresh, self.linscale, self.clip_value, self.precision
         )
 
 
@@ -140,6 +544,7 @@ class InvertedLinLogTransform(Transform):
         linthresh: float,
         linscale: float,
         clip_value: float | str,
+        precision: str = "double",
     ) -> None:
         """
         Initialize the inverted log transformation.
@@ -156,16 +561,73 @@ class InvertedLinLogTransform(Transform):
             Inputs that are <=0 (and therefore make a problem for the log scale) are set
             to this value in LinLogTransform. If the clip_value is "mask", values will
             be set to -np.inf and not plotted. The default is "mask".
+        precision : "single" | "double", optional
+            Floating point precision of the transformation. The default is "double".
+
+        Raises
+        ------
+        ValueError
+            Raised if 'base' is not larger than 1, 'linthresh' is not positive,
+            'linscale' is not positive or 'precision' is neither "single" nor
+            "double".
         """
         super().__init__()
+        _validate_parameters(base, linthresh, linscale, precision)
+
+        # the parameters are read-only, since the constants below are derived from them
+        self._base: float = base
+        self._linthresh: float = linthresh
+        self._linscale: float = linscale
+        self._clip_value: float | str = clip_value
+        self._precision: str = precision
+        self._linscale_adj: float = linscale / (1.0 - base**-1)
+        # base**x is calculated as exp(x * log(base))
+        self._log_base: float = float(np.log(base))
+        # the parameters are fixed at construction, so they are bound once instead of
+        # being looked up on every call
+        self._kernel: Optional[Callable] = None
+        if _inverse_kernel is not None:
+            self._kernel = functools.partial(
+                _inverse_kernel, self.linthresh, self._linscale_adj, self._log_base
+            )
 
-        linlog = LinLogTransform(base, linthresh, linscale, clip_value)
-        self.base: float = base
-        self.linthresh: float = linthresh
-        self.invlinthresh: float = linlog.transform(linthresh)
-        self.linscale: float = linscale
-        self.clip_value: float | str = clip_value
-        self._linscale_adj: float = linscale / (1.0 - self.base**-1)
+    @property
+    def base(self) -> float:
+        """Base of the logarithm."""
+        return self._base
+
+    @property
+    def linthresh(self) -> float:
+        """Threshold between linear and logarithmic regime."""
+        return self._linthresh
+
+    @property
+    def linscale(self) -> float:
+        """Factor by which the linear range is stretched."""
+        return self._linscale
+
+    @property
+    def clip_value(self) -> float | str:
+        """Value assigned to inputs <= 0, or "mask"."""
+        return self._clip_value
+
+    @property
+    def precision(self) -> str:
+        """Floating point precision of the transformation."""
+        return self._precision
+
+    @property
+    def invlinthresh(self) -> float:
+        """
+        Transformed linthresh. Deprecated, since linthresh is a fixed point of
+        LinLogTransform (log(1) = 0), so this is always equal to linthresh.
+        """
+        warnings.warn(
+            "'invlinthresh' is deprecated, use 'linthresh' instead.",
+            MatplotlibDeprecationWarning,
+            stacklevel=2,
+        )
+        return self.linthresh
 
     def transform_non_affine(self, values: np.ndarray) -> np.ndarray:
         """
@@ -181,24 +643,78 @@ class InvertedLinLogTransform(Transform):
         np.ndarray
             The transformed values.
         """
-        with np.errstate(divide="ignore", invalid="ignore"):
-            out = np.where(
-                np.abs(values) <= self.invlinthresh,
-                np.sign(values)
-                * self.linthresh
-                * np.exp((np.abs(values) / self.linthresh) - 1.0),
-                values,
-            )
+        xp = _array_module(values)
+        values = xp.asarray(values)
+        dtype = _working_dtype(values, self.precision)
+        # strided or misaligned arrays would miss the vectorized loops of the numpy
+        # ufuncs and cannot be passed to the compiled kernels, so they are copied
+        # (unlike ascontiguousarray, this keeps 0-d inputs 0-d)
+        values = xp.asarray(values, dtype=dtype, order="C")
+
+        if xp is np and self._kernel is not None:
+            out = np.empty_like(values)
+            self._kernel(values.ravel(), out.ravel())
+            return out
+        return self._transform_numpy(values.ravel(), xp).reshape(values.shape)
 
-            out = np.where(
-                np.abs(values) > self.invlinthresh,
-                np.sign(values)
-                * (
-                    self.linthresh
-                    + (np.abs(values) - self.invlinthresh) / self._linscale_adj
-                ),
-                out,
-            )
+    def _transform_numpy(self, values: np.ndarray, xp: Any = np) -> np.ndarray:
+        """
+        Perform the inverted custom log transformation on values using numpy.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The input values to be transformed.
+        xp : Any, optional
+            The array module of the values, numpy or cupy. The default is numpy.
+
+        Returns
+        -------
+        np.ndarray
+            The transformed values.
+        """
+        linthresh = self.linthresh
+        linscale_adj = self._linscale_adj
+        log_base = self._log_base
+
+        # the magnitude is calculated from the absolute values and the sign is
+        # applied once at the end
+        abs_values = xp.abs(values)
+
+        # the mask is calculated once and also decides if a branch can be skipped
+        log_mask = abs_values <= linthresh
+        num_log = xp.count_nonzero(log_mask)
+
+        # intermediate results are calculated in-place, to avoid temporary arrays
+        if num_log == 0:
+            # All values in the linear regime, skip the exponential entirely
+            out = xp.subtract(abs_values, linthresh)
+            out /= linscale_adj
+            out += linthresh
+        elif num_log == log_mask.size:
+            # All values in the logarithmic regime, no masking needed
+            out = xp.divide(abs_values, linthresh)
+            out -= 1.0
+            out *= log_base
+            xp.exp(out, out=out)
+            out *= linthresh
+        else:
+            # The cheap linear branch is calculated for all elements, the
+            # exponential only for the elements that need it
+            out = xp.subtract(abs_values, linthresh)
+            out /= linscale_adj
+            out += linthresh
+
+            log_values = abs_values[log_mask]
+            log_values /= linthresh
+            log_values -= 1.0
+            log_values *= log_base
+            xp.exp(log_values, out=log_values)
+            log_values *= linthresh
+            out[log_mask] = log_values
+
+        # np.sign (unlike np.copysign) keeps the inverse of 0 at 0
+        out *= xp.sign(values)
         return out
 
     def inverted(self) -> "LinLogTransform":
@@ -211,7 +727,7 @@ class InvertedLinLogTransform(Transform):
             The original transformation object.
         """
         return LinLogTransform(
-            self.base, self.linthresh, self.linscale, self.clip_value
+            self.base, self.linthresh, self.linscale, self.clip_value, self.precision
         )
 
 
@@ -273,10 +789,65 @@ class LinLogFormatter(ScalarFormatter):
                 label = label.rstrip("0").rstrip(".")
             return label
 
+    def format_ticks(self, values: np.ndarray) -> list[str]:
+        """
+        Format all tick values at once, calculating the number of decimal places for
+        the values within the linear threshold in a single vectorized pass.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The tick values to be formatted.
+
+        Returns
+        -------
+        list[str]
+            The formatted values as strings.
+        """
+        self.set_locs(values)
+
+        values = np.asarray(values, dtype=float)
+        abs_values = np.abs(values)
+        within_threshold = abs_values < self.linthresh
+        with np.errstate(divide="ignore", invalid="ignore"):
+            decimal_places = np.where(
+                abs_values > 0, np.abs(np.trunc(np.log10(abs_values))), 0
+            ).astype(int)
+
+        return [
+            f"{x:.{decimals}f}" if within else self(x, pos)
+            for pos, (x, within, decimals) in enumerate(
+                zip(values, within_threshold, decimal_places)
+            )
+        ]
+
 
 # ###################### LOCATOR #######################################################
 
 
+def _locator_state(locator: Locator) -> tuple:
+    """
+    Get the parameters of a locator in a comparable form, so that changes made with
+    set_params invalidate cached ticks.
+
+    Parameters
+    ----------
+    locator : Locator
+        The locator.
+
+    Returns
+    -------
+    tuple
+        The values of the attributes of the locator (except for the axis), with
+        arrays converted to tuples.
+    """
+    return tuple(
+        tuple(np.atleast_1d(value)) if isinstance(value, np.ndarray) else value
+        for name, value in vars(locator).items()
+        if name != "axis"
+    )
+
+
 class CombinedLogLinearLocator(Locator):
     """
     A custom locator for axes that combines both logarithmic and linear scales.
@@ -323,6 +894,8 @@ class CombinedLogLinearLocator(Locator):
         # Separate locators for log and linear regions
         self.log_locator = LogLocator(base=base, subs=subs, numticks=numticks_log)
         self.maxnlocator = MaxNLocator(numbins, symmetric=True)
+        # key and result of the last tick calculation
+        self._cache: tuple[Optional[tuple], Optional[np.ndarray]] = (None, None)
 
     def tick_values(self, vmin: float, vmax: float) -> np.ndarray:
         """
@@ -343,19 +916,92 @@ class CombinedLogLinearLocator(Locator):
         if vmin <= 0.0 and self.axis:
             vmin = self.axis.get_minpos()
 
+        # the parameters of the locator and of its public sub-locators can be changed
+        # after the construction, so they are part of the cache key
+        key = (
+            vmin,
+            vmax,
+            self.linthresh,
+            self.base,
+            tuple(np.atleast_1d(self.subs)),
+            self.numbins,
+            self.numticks_log,
+            _locator_state(self.log_locator),
+            _locator_state(self.maxnlocator),
+        )
+        cached_key, cached_ticks = self._cache
+        if cached_ticks is not None and cached_key == key:
+            return cached_ticks.copy()
+
         # Define range limits for log and linear parts
         log_vmin, log_vmax = min(vmin, self.linthresh), min(vmax, self.linthresh)
         linear_vmin, linear_vmax = max(vmin, self.linthresh), max(vmax, self.linthresh)
 
-        # Get ticks for log and linear regions
-        log_ticks = self.log_locator.tick_values(log_vmin, log_vmax)
-        log_ticks = log_ticks[log_ticks <= self.linthresh]
+        # Get ticks for log and linear regions. The closed form decade ticks and the
+        # linear ticks are sorted, so the ticks outside of the regions can be sliced
+        # off. LogLocator concatenates the subs decade by decade, so its ticks are not
+        # sorted if the subs are not ascending or exceed the base.
+        log_ticks = self._decade_ticks(log_vmin, log_vmax)
+        if log_ticks is None:
+            log_ticks = self.log_locator.tick_values(log_vmin, log_vmax)
+            log_ticks = log_ticks[log_ticks <= self.linthresh]
+        else:
+            log_ticks = log_ticks[: np.searchsorted(log_ticks, self.linthresh, "right")]
 
         linear_ticks = self.maxnlocator.tick_values(linear_vmin, linear_vmax)
-        linear_ticks = linear_ticks[linear_ticks > linear_vmin]
+        linear_ticks = linear_ticks[
+            np.searchsorted(linear_ticks, linear_vmin, "right") :
+        ]
 
         # Combine and return the ticks
-        return np.concatenate([log_ticks, linear_ticks])
+        ticks = np.concatenate([log_ticks, linear_ticks])
+        self._cache = (key, ticks.copy())
+        return ticks
+
+    def _decade_ticks(self, vmin: float, vmax: float) -> Optional[np.ndarray]:
+        """
+        Calculate the ticks of the logarithmic region in closed form, for the common
+        case of one tick per decade. The result is identical to the one of
+        LogLocator.tick_values, including the additional tick below and above the
+        range.
+
+        Parameters
+        ----------
+        vmin : float
+            Minimum value of the logarithmic region.
+        vmax : float
+            Maximum value of the logarithmic region.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Array of tick values, or None if the ticks need the general algorithm of
+            LogLocator (minor ticks, invalid ranges, or too many decades so that not
+            every decade gets a tick).
+        """
+        # the parameters are taken from the log locator, so that the closed form and
+        # the fallback always agree
+        subs = self.log_locator._subs
+        if isinstance(subs, str) or tuple(np.atleast_1d(subs)) != (1.0,):
+            return None
+        if not (0.0 < vmin <= vmax and math.isfinite(vmax)):
+            return None
+
+        base = self.log_locator._base
+        if base == 10.0:
+            efmin, efmax = np.log10([vmin, vmax])
+        elif base == 2.0:
+            efmin, efmax = np.log2([vmin, vmax])
+        else:
+            efmin, efmax = np.log([vmin, vmax]) / np.log(base)
+        emin, emax = math.ceil(efmin), math.floor(efmax)
+
+        # the log locator is not attached to an axis, so 'auto' means 9 ticks
+        numticks = self.log_locator.numticks
+        max_ticks = 9 if numticks == "auto" else numticks
+        if not 2 <= emax - emin + 1 <= max_ticks:
+            return None
+        return base ** np.arange(emin - 1, emax + 2)
 
     def __call__(self) -> np.ndarray:
         """
@@ -448,6 +1094,7 @@ class LinLogScale(LogScale):
         linscale: float = 1,
         clip_value: float | str = "mask",
         subs: Optional[tuple] = None,
+        precision: str = "double",
     ) -> None:
         """
         Initialize the custom symmetrical logarithmic scale.
@@ -468,9 +1115,15 @@ class LinLogScale(LogScale):
             be set to -np.inf and not plotted. The default is "mask".
         subs : Optional[tuple], optional
             The sequence of the location of the minor ticks.
+        precision : "single" | "double", optional
+            Floating point precision of the transformation. Single precision is
+            faster for large datasets and still accurate far below a pixel. The
+            default is "double".
         """
         super().__init__(axis)
-        self._transform = LinLogTransform(base, linthresh, linscale, clip_value)
+        self._transform = LinLogTransform(
+            base, linthresh, linscale, clip_value, precision
+        )
         self.subs = subs
 
     @property